@@ -132,6 +132,29 @@ class BMP280:
         self._write(0xf4, self._configuration.ctrl_meas)
         sleep_ms(5)  # Wait briefly so the changes can be applied
     
+    def _measure(self):
+        if self._configuration.power_mode == BMP280Configuration.POWER_MODE_FORCED:
+            self._write_ctrl_meas()
+
+        rxdata = self._read(0xf7, 6)
+
+        p_adc = rxdata[0] << 12 | rxdata[1] << 4 | rxdata[2] >> 4
+        t_adc = rxdata[3] << 12 | rxdata[4] << 4 | rxdata[5] >> 4
+
+        t, t_fine = self._calculate_temperature(t_adc)
+        p = self._calculate_pressure(p_adc, t_fine)
+
+        return t, t_adc, p, p_adc
+
+    @property
+    def temperature_pressure(self) -> tuple:
+        """Get temperature_pressure
+
+        Returns a (temperature, pressure) tuple with the most recent measurements, without allocating a dictionary.
+        """
+        t, _, p, _ = self._measure()
+        return t, p
+
     @property
     def measurements(self) -> dict:
         """Get measurements
@@ -143,20 +166,11 @@ class BMP280:
         'p': pressure,
         'p_adc': the 'raw' pressure as produced by the ADC
         """
-        if self._configuration.power_mode == BMP280Configuration.POWER_MODE_FORCED:
-            self._write_ctrl_meas()
-
-        rxdata = self._read(0xf7, 6)
-
-        p_adc = rxdata[0] << 12 | rxdata[1] << 4 | rxdata[2] >> 4
-        t_adc = rxdata[3] << 12 | rxdata[4] << 4 | rxdata[5] >> 4
-
-        temperature = self._calculate_temperature(t_adc)
-        pressure = self._calculate_pressure(p_adc, temperature[1])
+        t, t_adc, p, p_adc = self._measure()
 
         return {
-            't': temperature[0],
+            't': t,
             't_adc': t_adc,
-            'p': pressure,
+            'p': p,
             'p_adc': p_adc
         }
@@ -8,19 +8,15 @@ XIAO-ESP32S3_I2C_20250216
 # Copyright (c) 2024 Eric Gionet (gionet.c.eric@gmail.com)
 # Released under the MIT License (MIT) - see LICENSE file
 
-import asyncio, config
+import asyncio, config, micropython
 
-from machine import Pin, I2C
+from machine import Pin, I2C, reset
 from scheduler import TimeIntoInterval, TimeIntoIntervalTypes
-from scheduler import Scheduler #https://github.com/peterhinch/micropython-async/blob/master/v3/docs/SCHEDULE.md
 from bmp280 import BMP280I2C # https://github.com/flrrth/pico-bmp280
 from sht4x import SHT4X # https://github.com/jposada202020/MicroPython_SHT4X
 from net_if import connect_wifi, disconnect_wifi, synch_ntp_time, format_localtime
 
 
-# Instantiate scheduler object
-scheduler = Scheduler()
-
 # Instantiate I2C bus object
 i2c0_bus = I2C(config.i2c0_bus_id, sda=Pin(config.i2c0_sda_io), scl=Pin(config.i2c0_scl_io), freq=config.i2c0_freq_hz)
 
@@ -30,8 +26,12 @@ bmp280_i2c = BMP280I2C(config.bmp280_addr, i2c0_bus, config.bmp280_config)
 # Instantiate SHT4X I2C object
 sht4x_i2c = SHT4X(config.sht4x_addr, i2c0_bus, config.sht4x_config)
 
+# Instantiate I2C bus 0 lock object, held while a device transaction window is open
+i2c0_lock = asyncio.Lock()
+
 
 
+@micropython.native
 async def poll_i2c0_devices_task(task_id: str) -> None:
     """
     # poll_i2c0_devices_task
@@ -43,16 +43,19 @@ async def poll_i2c0_devices_task(task_id: str) -> None:
         
     """
     try:
-        # Read BMP280 measurements
-        readout = bmp280_i2c.measurements
-
-        # Read SHT4X measurements
-        temperature, relative_humidity = sht4x_i2c.measurements
+        async with i2c0_lock:
+            # Start SHT4X measurement
+            delay_ms = sht4x_i2c.start_measurement()
+            
+            # Read BMP280 measurements while the SHT4X converts
+            _, pressure = bmp280_i2c.temperature_pressure
+            
+            # Read SHT4X measurements once converted
+            await asyncio.sleep_ms(delay_ms)
+            temperature, relative_humidity = sht4x_i2c.read_measurements()
         
         # Print results
-        print(f"{task_id}: {format_localtime()} Temperature: {temperature:.2f} C | Humidity: {relative_humidity:.2f} % | Pressure: {readout['p']:.2f} hPa.")
-        
-        await asyncio.sleep(0)
+        print(f"{task_id}: {format_localtime()} Temperature: {temperature:.2f} C | Humidity: {relative_humidity:.2f} % | Pressure: {pressure:.2f} hPa.")
     except RuntimeError as error:
         print(f'{task_id}: Runtime Error: ', error.args[0])
     except OSError as e:
@@ -61,6 +64,25 @@ async def poll_i2c0_devices_task(task_id: str) -> None:
         print(f'{task_id}: Keyboard Interrupt')
 
 
+async def poll_i2c0_devices_loop(task_id: str) -> None:
+    """
+    # poll_i2c0_devices_loop
+    
+    Polls I2C devices on bus 0 once a minute, synchronized to the system clock.
+    
+    Args:
+        task_id (str): Task unique identifier.
+        
+    """
+    # Instantiate time-into-interval object
+    tii_1_0min = TimeIntoInterval(TimeIntoIntervalTypes.TIME_INTO_INTERVAL_MIN, 1) # 1-minute interval with no offset
+    
+    # Loop forever
+    while True:
+        await tii_1_0min.interval_sleep()
+        await poll_i2c0_devices_task(task_id)
+
+
 async def do_work_task(task_id: str) -> None:
     """
     # do_work_task
@@ -114,27 +136,22 @@ async def main() -> None:
 
     # Create scheduled tasks
     asyncio.create_task(do_work_task("tsk0"))
-    asyncio.create_task(scheduler.create_schedule(poll_i2c0_devices_task, "tsk1", hrs=None, mins=range(0, 60, 1)))  # poll i2c device(s) every minute
+    asyncio.create_task(poll_i2c0_devices_loop("tsk1"))  # poll i2c device(s) every minute
     
-    # Loop forever
-    while True:
-        try:
-            await asyncio.sleep(1)
-        except RuntimeError as error:
-            print('Runtime Error: ', error.args[0])
-            break
-        except OSError as e:
-            print('OS Error: ', e.args[0])
-            break
-        except KeyboardInterrupt:
-            print('Keyboard Interrupt')
-            break
+    # Wait forever, the scheduled tasks do the work (no periodic wakeups)
+    await asyncio.Event().wait()
 
 
 """Application entry point"""
 if __name__ == '__main__':
     try:
         asyncio.run(main())
+    except RuntimeError as error:
+        # Network start-up failed (no wifi or ntp), reset the system and retry from boot
+        print('Runtime Error: ', error.args[0])
+        reset()
+    except KeyboardInterrupt:
+        print('Keyboard Interrupt')
     finally:
         _ = asyncio.new_event_loop()
 
@@ -5,8 +5,8 @@ Synchronizing system time with NTP server
 # Copyright (c) 2024 Eric Gionet (gionet.c.eric@gmail.com)
 # Released under the MIT License (MIT) - see LICENSE file
 
-import asyncio, config, network, ntptime, timezone
-from machine import reset, RTC
+import asyncio, config, network, ntptime, time, timezone
+from machine import RTC
 
 
 # Instantiate RTC object
@@ -15,6 +15,23 @@ rtc = RTC()
 # Instantiate WLAN station interface object
 wlan = network.WLAN(network.STA_IF)
 
+# Wifi network status labels by status code
+_wifi_status_labels = {
+    network.STAT_IDLE: "idle",
+    network.STAT_CONNECTING: "connecting",
+    network.STAT_WRONG_PASSWORD: "wrong password",
+    network.STAT_NO_AP_FOUND: "no ap found",
+    network.STAT_GOT_IP: "got ip",
+}
+
+# Local-time offset (seconds) cache, valid until the next utc hour or dst schedule boundary
+_cached_off   = 0
+_cached_until = 0
+
+# Formatted local-time cache, valid for the minute it was formatted in
+_cached_min = -1
+_cached_str = ""
+
 
 
 def format_localtime() -> str:
@@ -24,11 +41,34 @@ def format_localtime() -> str:
     Gets formatted local-time as a string (yyyy-mm-dd HH:MM).
     
     """
-    # Get date-time parts from internal RTC
-    (year, month, day, hrs, mins, secs, wday, yday) = timezone.localtime(config.ntp_timezone_info)
+    global _cached_off, _cached_until, _cached_min, _cached_str
+    
+    now = time.time()
+    
+    # Evaluate time-zone and dst offset only once the cached offset expires
+    if now >= _cached_until:
+        tz = config.ntp_timezone_info
+        local = time.mktime(timezone.localtime(tz))
+        _cached_off   = (local - now + 30) // 60 * 60
+        _cached_until = now - now % 3600 + 3600
+        _cached_min   = -1
+        
+        # Expire sooner when dst starts or ends before the next utc hour
+        boundary = tz.next_dst_boundary(now)
+        if boundary is not None and boundary < _cached_until:
+            _cached_until = boundary
+    
+    # Format the current date-time only once per minute
+    now_min = now // 60
+    if now_min != _cached_min:
+        # Get date-time parts from internal RTC
+        (year, month, day, hrs, mins, secs, wday, yday) = time.gmtime(now + _cached_off)[:8]
+        
+        # Format the current date-time as a string "yyyy-mm-dd HH:MM"
+        _cached_min = now_min
+        _cached_str = f"{year:04d}-{month:02d}-{day:02d} {hrs:02d}:{mins:02d}"
     
-    # Format the current date-time as a string "yyyy-mm-dd HH:MM"
-    return "{:02d}-{:02d}-{} {:02d}:{:02d}".format(year, month, day, hrs, mins)
+    return _cached_str
 
 
 def format_utctime() -> str:
@@ -42,7 +82,7 @@ def format_utctime() -> str:
     (year, month, day, hrs, mins, secs, wday, yday) = timezone.gmtime()
     
     # Format the current utc date-time as a string "yyyy-mm-dd HH:MM"
-    return "{:02d}-{:02d}-{} {:02d}:{:02d}".format(year, month, day, hrs, mins)
+    return f"{year:04d}-{month:02d}-{day:02d} {hrs:02d}:{mins:02d}"
     
     
 async def synch_ntp_time() -> None:
@@ -52,10 +92,11 @@ async def synch_ntp_time() -> None:
     Synchronizes system time with NTP time server and initializes RTC to UTC time.
     
     """
+    global _cached_until
+    
     # validate network connectivity
     if not wlan.isconnected():
         raise RuntimeError('no wifi connection')
-        reset()
     
     # Set configured NTP host and timeout
     ntptime.host    = config.ntp_host
@@ -64,10 +105,29 @@ async def synch_ntp_time() -> None:
     # Get UTC time from NTP host (this function will set the system RTC to UTC)
     ntptime.settime()
     
+    # Invalidate the local-time cache, the system clock has moved
+    _cached_until = 0
+    
     # Print local and utc timestamps
     print(f"System local date-time: {format_localtime()}  |  System UTC date-time: {format_utctime()}")
+
+
+async def _wait_for_ip() -> None:
+    """
+    # _wait_for_ip
+    
+    Waits until the wifi interface obtains an ip address, reporting status changes only.
     
-    await asyncio.sleep(0)
+    """
+    last_status = None
+    while True:
+        status = wlan.status()
+        if status == network.STAT_GOT_IP:
+            return
+        if status != last_status:
+            last_status = status
+            print('connecting...')
+        await asyncio.sleep_ms(100)
 
 
 async def connect_wifi() -> None:
@@ -85,24 +145,18 @@ async def connect_wifi() -> None:
     
     # Wait for connect or fail
     print('waiting for wifi connection ...')
-    max_wait = 30
-    while max_wait > 0:
-        if wlan.isconnected() == True:
-            break
-        print('connecting...')
-        max_wait -= 1
-        await asyncio.sleep(0.5)
+    try:
+        await asyncio.wait_for(_wait_for_ip(), 15)
+    except asyncio.TimeoutError:
+        pass
 
     # Handle connection error
     if not wlan.isconnected():
         raise RuntimeError('wifi connection failed')
-        reset()
     else:
         print('wifi connected: ' + wifi_status())
         status = wlan.ifconfig()
         print('ip = ' + status[0])
-        
-    await asyncio.sleep(0)
 
 
 async def disconnect_wifi() -> None:
@@ -118,13 +172,9 @@ async def disconnect_wifi() -> None:
     # deactivate wifi interface
     if wlan.active():
         wlan.active(False)
-        
-    # validate wifi connection status
-    if not wlan.isconnected():
-        network.STAT_GOT_IP
-        print('wifi disconnected: ' + wifi_status())
-        
-    await asyncio.sleep(0)
+    
+    # an inactive interface cannot be connected
+    print('wifi disconnected: ' + wifi_status())
 
 
 def wifi_status() -> str:
@@ -134,18 +184,7 @@ def wifi_status() -> str:
     Gets wifi network status.
     
     """
-    if wlan.status() == network.STAT_IDLE:
-        return "idle"
-    elif wlan.status() == network.STAT_CONNECTING:
-        return "connecting"
-    elif wlan.status() == network.STAT_WRONG_PASSWORD:
-        return "wrong password"
-    elif wlan.status() == network.STAT_NO_AP_FOUND:
-        return "no ap found"
-    elif wlan.status() == network.STAT_GOT_IP:
-        return "got ip"
-    else:
-        return "unknown"
+    return _wifi_status_labels.get(wlan.status(), "unknown")
 
 
 def is_wifi_connected() -> bool:
@@ -8,31 +8,45 @@
 # It holds no state.
 # See docs for restrictions and limitations.
 
+import micropython
 from time import mktime, localtime
 
+
+# Precompile an arg to None, an int or a sorted tuple of trigger values
+def _precompile(a):
+    if a is None or isinstance(a, int):
+        return a
+    try:
+        return tuple(sorted(a))
+    except TypeError:
+        raise ValueError('Invalid argument type', type(a))
+
+
+# Given a precompiled arg and current value, return offset between arg and cv
+# If arg is a sorted tuple bisect for the next arg >= cv, else wrap-round to the first (-ve)
+@micropython.native
+def _next_offset(a, cv) -> int:  # Arg, current value
+    if a is None:
+        return 0
+    if type(a) is int:
+        return a - cv
+    lo = 0
+    hi = len(a)
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if a[mid] < cv:
+            lo = mid + 1
+        else:
+            hi = mid
+    return (a[lo] if lo < len(a) else a[0]) - cv
+
+
 class Cron:
-    def __init__(self):
-        # Validation
-        self._valid = ((0, 59, 'secs'), (0, 59, 'mins'), (0, 23, 'hrs'),
-                (1, 31, 'mday'), (1, 12, 'month'), (0, 6, 'wday'))
-        self._mdays = {2:28, 4:30, 6:30, 9:30, 11:30}
-
-    # Given an arg and current value, return offset between arg and cv
-    # If arg is iterable return offset of next arg +ve for future -ve for past (add modulo)
-    @staticmethod
-    def _do_arg(a, cv) -> int:  # Arg, current value
-        if a is None:
-            return 0
-        elif isinstance(a, int):
-            return a - cv
-        try:
-            return min(x for x in a if x >= cv) - cv
-        except ValueError:  # wrap-round
-            return min(a) - cv  # -ve
-        except TypeError:
-            raise ValueError('Invalid argument type', type(a))
-            
-      
+    # Validation, shared by all instances
+    _VALID = ((0, 59, 'secs'), (0, 59, 'mins'), (0, 23, 'hrs'),
+            (1, 31, 'mday'), (1, 12, 'month'), (0, 6, 'wday'))
+    _MDAYS = {2:28, 4:30, 6:30, 9:30, 11:30}
+
     # A call to the inner function takes 270-520μs on Pyboard depending on args
     def job_event_time(self, *, secs=0, mins=0, hrs=3, mday=None, month=None, wday=None) -> int:
         """
@@ -58,21 +72,22 @@ class Cron:
             int: The amount of time the job has to wait in seconds since epoch.
             
         """
-        self._secs = secs
-        self._mins = mins
-        self._hrs = hrs
-        self._mday = mday
-        self._month = month
-        self._wday = wday
+        # Precompile iterables to sorted tuples once rather than scanning them on every call
+        self._secs = _precompile(secs)
+        self._mins = _precompile(mins)
+        self._hrs = _precompile(hrs)
+        self._mday = _precompile(mday)
+        self._month = _precompile(month)
+        self._wday = _precompile(wday)
         
         if self._secs is None:  # Special validation for seconds
             raise ValueError('Invalid None value for secs')
         if not isinstance(self._secs, int) and len(self._secs) > 1:  # It's an iterable
-            ss = sorted(self._secs)
+            ss = self._secs
             if min((a[1] - a[0] for a in zip(ss, ss[1:]))) < 10:
                 raise ValueError("Seconds values must be >= 10s apart.")
         args = (self._secs, self._mins, self._hrs, self._mday, self._month, self._wday)  # Validation for all args
-        valid = iter(self._valid)
+        valid = iter(Cron._VALID)
         vestr = 'Argument {} out of range'
         vmstr = 'Invalid no. of days for month'
         for arg in args:  # Check for illegal arg values
@@ -80,75 +95,85 @@ class Cron:
             if isinstance(arg, int):
                 if not lower <= arg <= upper:
                     raise ValueError(vestr.format(errtxt))
-            elif arg is not None:  # Must be an iterable
-                if any(v for v in arg if not lower <= v <= upper):
+            elif arg is not None:  # Must be a non-empty iterable
+                if not arg or any(v for v in arg if not lower <= v <= upper):
                     raise ValueError(vestr.format(errtxt))
         if self._mday is not None and self._month is not None:  # Check mday against month
             max_md = self._mday if isinstance(self._mday, int) else max(self._mday)
             if isinstance(self._month, int):
-                if max_md > self._mdays.get(month, 31):
+                if max_md > Cron._MDAYS.get(month, 31):
                     raise ValueError(vmstr)
-            elif sum((m for m in self._month if max_md > self._mdays.get(m, 31))):
+            elif sum((m for m in self._month if max_md > Cron._MDAYS.get(m, 31))):
                 raise ValueError(vmstr)
-        if self._mday is not None and self._wday is not None and self.do_arg(self._mday, 23) > 0:
+        if self._mday is not None and self._wday is not None and _next_offset(self._mday, 23) > 0:
             raise ValueError('mday must be <= 22 if wday also specified.')
 
+        @micropython.native
         def inner(tnow) -> int:
+            # Bind globals and attributes to locals once: each lookup is a dict probe
+            _lt = localtime
+            _mk = mktime
+            _da = _next_offset
+            secs = self._secs
+            mins = self._mins
+            hrs = self._hrs
+            month = self._month
+            mday = self._mday
+            wday = self._wday
+
             tev = tnow  # Time of next event: work forward from time now
-            yr, mo, md, h, m, s, wd = localtime(tev)[:7]
-            init_mo = mo  # Month now
-            toff = self._do_arg(self._secs, s)
+            t = _lt(tev)
+            init_mo = t[1]  # Month now
+            toff = _da(secs, t[5])
             tev += toff if toff >= 0 else 60 + toff
 
-            yr, mo, md, h, m, s, wd = localtime(tev)[:7]
-            toff = self._do_arg(self._mins, m)
+            toff = _da(mins, _lt(tev)[4])
             tev += 60 * (toff if toff >= 0 else 60 + toff)
 
-            yr, mo, md, h, m, s, wd = localtime(tev)[:7]
-            toff = self._do_arg(self._hrs, h)
+            toff = _da(hrs, _lt(tev)[3])
             tev += 3600 * (toff if toff >= 0 else 24 + toff)
 
-            yr, mo, md, h, m, s, wd = localtime(tev)[:7]
-            toff = self._do_arg(self._month, mo)
+            yr, mo, md, h, m, s, wd = _lt(tev)[:7]
+            toff = _da(month, mo)
             mo += toff
             md = md if mo == init_mo else 1
             if toff < 0:
                 yr += 1
-            tev = mktime((yr, mo, md, h, m, s, wd, 0))
-            yr, mo, md, h, m, s, wd = localtime(tev)[:7]
-            if self._mday is not None:
+            tev = _mk((yr, mo, md, h, m, s, wd, 0))
+            yr, mo, md, h, m, s, wd = _lt(tev)[:7]
+            if mday is not None:
                 if mo == init_mo:  # Month has not rolled over or been changed
-                    toff = self._do_arg(self._mday, md)  # see if mday causes rollover
+                    toff = _da(mday, md)  # see if mday causes rollover
                     md += toff
                     if toff < 0:
-                        toff = self._do_arg(self._month, mo + 1)  # Get next valid month
+                        toff = _da(month, mo + 1)  # Get next valid month
                         mo += toff + 1  # Offset is relative to next month
                         if toff < 0:
                             yr += 1
                 else:  # Month has rolled over: day is absolute
-                    md = self._do_arg(self._mday, 0)
+                    md = _da(mday, 0)
 
-            if self._wday is not None:
+            if wday is not None:
                 if mo == init_mo:
-                    toff = self._do_arg(self._wday, wd)
+                    toff = _da(wday, wd)
                     md += toff % 7  # mktime handles md > 31 but month may increment
-                    tev = mktime((yr, mo, md, h, m, s, wd, 0))
+                    tev = _mk((yr, mo, md, h, m, s, wd, 0))
                     cur_mo = mo
-                    mo = localtime(tev)[1]  # get month
+                    mo = _lt(tev)[1]  # get month
                     if mo != cur_mo:
-                        toff = self._do_arg(self._month, mo)  # Get next valid month
+                        toff = _da(month, mo)  # Get next valid month
                         mo += toff  # Offset is relative to new, incremented month
                         if toff < 0:
                             yr += 1
-                        tev = mktime((yr, mo, 1, h, m, s, wd, 0))  # 1st of new month
-                        yr, mo, md, h, m, s, wd = localtime(tev)[:7]  # get day of week
-                        toff = self._do_arg(self._wday, wd)
+                        tev = _mk((yr, mo, 1, h, m, s, wd, 0))  # 1st of new month
+                        yr, mo, md, h, m, s, wd = _lt(tev)[:7]  # get day of week
+                        toff = _da(wday, wd)
                         md += toff % 7
                 else:
-                    md = 1 if self._mday is None else md
-                    tev = mktime((yr, mo, md, h, m, s, wd, 0))  # 1st of new month
-                    yr, mo, md, h, m, s, wd = localtime(tev)[:7]  # get day of week
-                    md += (self._do_arg(self._wday, 0) - wd) % 7
+                    md = 1 if mday is None else md
+                    tev = _mk((yr, mo, md, h, m, s, wd, 0))  # 1st of new month
+                    yr, mo, md, h, m, s, wd = _lt(tev)[:7]  # get day of week
+                    md += (_da(wday, 0) - wd) % 7
 
-            return mktime((yr, mo, md, h, m, s, wd, 0)) - tnow
+            return _mk((yr, mo, md, h, m, s, wd, 0)) - tnow
         return inner
\ No newline at end of file
@@ -7,8 +7,8 @@
 # Released under the MIT License (MIT) - see LICENSE file
 
 import asyncio
-from time import time, mktime, localtime
-from scheduler.cron import Cron
+from time import time
+from scheduler.cron import Cron, _precompile
 from scheduler.sequence import Sequence
 from micropython import const
 
@@ -21,6 +21,9 @@ class Scheduler:  # Enable asynchronous iterator interface
     # https://github.com/peterhinch/micropython-async/blob/master/v3/docs/SCHEDULE.md#71-initialisation
     PAUSE = const(2)
     
+    # Cron event time functions shared by schedules with the same arguments
+    _cron_cache = {}
+    
     def __init__(self) -> None:
         self._evt = asyncio.Event()
         self._type_coro = type(self._g())
@@ -50,6 +53,11 @@ class Scheduler:  # Enable asynchronous iterator interface
             t (int): Sleep duration in seconds.
             
         """
+        if t <= 0:
+            return
+        if t <= Scheduler.MAXT:  # Fast path: almost all waits fit in one segment
+            await asyncio.sleep(t)
+            return
         while t > 0:
             await asyncio.sleep(min(t, Scheduler.MAXT))
             t -= Scheduler.MAXT
@@ -76,6 +84,29 @@ class Scheduler:  # Enable asynchronous iterator interface
         return res
 
     
+    @staticmethod
+    def _cron(kwargs):
+        """
+        # _cron
+
+        Gets the cron event time function for the schedule arguments, validating and creating 
+        it only once per distinct set of arguments.
+
+        Args:
+            kwargs (dict): Cron schedule arguments (secs, mins, hrs, mday, month, wday).
+
+        Returns:
+            function: Cron event time function returning the seconds to wait from a given time.
+            
+        """
+        key = tuple(sorted((k, _precompile(v)) for k, v in kwargs.items()))
+        fcron = Scheduler._cron_cache.get(key)
+        if fcron is None:
+            fcron = Cron().job_event_time(**kwargs)
+            Scheduler._cron_cache[key] = fcron
+        return fcron
+
+    
     async def create_schedule(self, func, *args, times=None, **kwargs) -> any:
         """
         # create_schedule
@@ -98,19 +129,24 @@ class Scheduler:  # Enable asynchronous iterator interface
             
         """
         
-        tim = mktime(localtime()[:3] + (0, 0, 0, 0, 0))  # Midnight last night
-        now = round(time())  # round() is for Unix
-        cron = Cron() # Instantiate cron object
-        fcron = cron.job_event_time(**kwargs)  # Cron instance for search.
+        _time = time  # Bind once, called on every wakeup
+        now = int(_time())  # int() is for Unix
+        tim = now - (now % 86400)  # Midnight last night (RTC runs on UTC)
+        fcron = Scheduler._cron(kwargs)  # Cron instance for search (shared).
         while tim < now:  # Find first future trigger in sequence
             # Defensive. fcron should never return 0, but if it did the loop would never quit
             tim += max(fcron(tim), 1)
         # Wait until just before the first future trigger
         await self._long_sleep(tim - now - Scheduler.PAUSE)  # Time to wait (can be < 0)
 
+        last = -1  # Epoch time (s) of the last trigger
         while times is None or times > 0:  # Until all repeats are done (or forever).
-            tw = fcron(round(time()))  # Time to wait (s) (fcron is stateless).
+            now = int(_time())
+            tw = fcron(now)  # Time to wait (s) (fcron is stateless).
+            if tw <= 0 and now == last:  # Already triggered this second, wait for the next trigger
+                tw = 1 + fcron(now + 1)
             await self._long_sleep(tw)
+            last = now + tw
             res = None
             if isinstance(func, asyncio.Event):
                 func.set()
@@ -120,7 +156,6 @@ class Scheduler:  # Enable asynchronous iterator interface
                 res = self._launch_job(func, args)
             if times is not None:
                 times -= 1
-            await asyncio.sleep_ms(1200)  # ensure we're into next second
         return res
     
     
\ No newline at end of file
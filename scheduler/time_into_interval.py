@@ -1,21 +1,44 @@
 # Copyright (c) 2024 Eric Gionet (gionet.c.eric@gmail.com)
 # Released under the MIT License (MIT) - see LICENSE file
 
-import asyncio, time
+import asyncio, micropython, time
 
 from micropython import const
 
+try:
+    from time import time_ns as _time_ns
+except ImportError:
+    # Port without time_ns, time() is an integer on MicroPython
+    def _time_ns() -> int:
+        return time.time() * 1000000000
 
 
+# Interval-type values, folded to integer literals at compile time (see TimeIntoIntervalTypes)
+_TYPE_SEC = const(0)
+_TYPE_MIN = const(1)
+_TYPE_HR  = const(2)
+
+_MSEC_PER_SEC = const(1000)
+_MSEC_PER_MIN = const(60 * 1000)
+_MSEC_PER_HR  = const(60 * 60 * 1000)
+_MSEC_PER_DAY = const(24 * 60 * 60 * 1000)
+_MSEC_MAX_PERIOD = 28 * _MSEC_PER_DAY   # 28-days, too large for a small int const
+
+# Milliseconds per interval-type unit, indexed by interval-type (_TYPE_SEC, _TYPE_MIN, _TYPE_HR)
+_INTERVAL_MULT_MSEC = (_MSEC_PER_SEC, _MSEC_PER_MIN, _MSEC_PER_HR)
+
+# Wall-clock alignment of the first event in milliseconds (start of minute, hour, day), indexed by interval-type (_TYPE_SEC, _TYPE_MIN, _TYPE_HR)
+_INTERVAL_ALIGN_MSEC = (_MSEC_PER_MIN, _MSEC_PER_HR, _MSEC_PER_DAY)
+
 
 
 class TimeIntoIntervalTypes:
     """TimeIntoIntervalTypes enum"""
-    TIME_INTO_INTERVAL_SEC = const(0)
+    TIME_INTO_INTERVAL_SEC = _TYPE_SEC
     """Time into interval precision type is seconds."""
-    TIME_INTO_INTERVAL_MIN = const(1)
+    TIME_INTO_INTERVAL_MIN = _TYPE_MIN
     """Time into interval precision type is minutes."""
-    TIME_INTO_INTERVAL_HR  = const(2)
+    TIME_INTO_INTERVAL_HR  = _TYPE_HR
     """Time into interval precision type is hours."""
     
 
@@ -34,6 +57,8 @@ class TimeIntoInterval:
     MAXT_MSEC = const(100)
     """asyncio can't handle long delays so split into 100msec segments"""
     
+    __slots__ = ('_interval_type', '_interval_period', '_interval_offset', '_interval_period_msec', '_interval_offset_msec', '_next_epoch_time_msec')
+    
     def __init__(self, interval_type: TimeIntoIntervalTypes, interval_period: int, interval_offset: int = 0) -> None:
         """
         # TimeIntoInterval
@@ -69,18 +94,20 @@ class TimeIntoInterval:
         interval_offset_msec = self.normalize_interval_msec(interval_type, interval_offset)
         
         # Validate interval period argument on total days
-        if interval_period_msec >= (28 * 24 * 60 * 60 * 1000):
+        if interval_period_msec >= _MSEC_MAX_PERIOD:
             raise ValueError("Interval period cannot be greater than 28-days")
         
         # Validate period and offset intervals
         if (interval_period_msec - interval_offset_msec) < 0:
             raise ValueError("Interval period must be larger than the interval offset")
         
-        # Initialize private variables
+        # Initialize private variables, normalized interval period and offset are immutable
         self._interval_type        = interval_type
         self._interval_period      = interval_period
         self._interval_offset      = interval_offset
-        self._next_epoch_time_msec = self.epoch_time_next_event_msec(interval_type, interval_period, interval_offset)
+        self._interval_period_msec = interval_period_msec
+        self._interval_offset_msec = interval_offset_msec
+        self._next_epoch_time_msec = None   # Computed on first use, see `next_epoch_time_msec`
     
     
     async def _long_sleep_msec(self, t: int) -> None:
@@ -93,11 +120,19 @@ class TimeIntoInterval:
             t (int): Sleep interval in milliseconds.
             
         """
+        if t <= 0:
+            return
+        sleep_ms = asyncio.sleep_ms
+        step = TimeIntoInterval.MAXT_MSEC
+        if t <= step:  # Fast path: fits in one segment
+            await sleep_ms(t)
+            return
         while t > 0:
-            await asyncio.sleep_ms(min(t, TimeIntoInterval.MAXT_MSEC))
-            t -= TimeIntoInterval.MAXT_MSEC
+            await sleep_ms(step if t > step else t)
+            t -= step
         
     
+    @micropython.native
     def normalize_interval_msec(self, interval_type: TimeIntoIntervalTypes, interval_period: int) -> int:
         """
         # normalize_interval_msec
@@ -112,25 +147,24 @@ class TimeIntoInterval:
             int: Interval in milliseconds.
         
         Raises:
-            ValueError: If `interval_period` is greater than 28-days.
+            ValueError: If `interval_type` is invalid or `interval_period` is greater than 28-days.
             
         """
+        # Validate interval type argument before indexing (negative indexes would wrap-round)
+        if interval_type not in (_TYPE_SEC, _TYPE_MIN, _TYPE_HR):
+            raise ValueError("Interval type is not a valid TimeIntoIntervalTypes")
+        
         # Normalize interval period to milliseconds
-        interval_msec = 0
-        if(interval_type == TimeIntoIntervalTypes.TIME_INTO_INTERVAL_SEC):
-            interval_msec = interval_period * 1000
-        elif(interval_type == TimeIntoIntervalTypes.TIME_INTO_INTERVAL_MIN):
-            interval_msec = interval_period * 60 * 1000
-        elif(interval_type == TimeIntoIntervalTypes.TIME_INTO_INTERVAL_HR):
-            interval_msec = interval_period * 60 * 60 * 1000
+        interval_msec = interval_period * _INTERVAL_MULT_MSEC[interval_type]
         
         # Validate interval period argument on total days
-        if interval_msec >= (28 * 24 * 60 * 60 * 1000):
+        if interval_msec >= _MSEC_MAX_PERIOD:
             raise ValueError("Interval period cannot be greater than 28-days")
         
         return interval_msec
     
     
+    @micropython.native
     def epoch_time_next_event_msec(self, interval_type: TimeIntoIntervalTypes, interval_period: int, interval_offset: int, epoch_time_last_event_msec: int = 0) -> int:
         """
         # epoch_time_next_event_msec
@@ -166,68 +200,36 @@ class TimeIntoInterval:
         interval_offset_msec = self.normalize_interval_msec(interval_type, interval_offset)
         
         # Validate interval period argument on total days
-        if interval_period_msec >= (28 * 24 * 60 * 60 * 1000):
+        if interval_period_msec >= _MSEC_MAX_PERIOD:
             raise ValueError("Interval period cannot be greater than 28-days")
         
         # Validate period and offset intervals
         if (interval_period_msec - interval_offset_msec) < 0:
             raise ValueError("Interval period must be larger than the interval offset")
+        
+        return self._epoch_time_next_event_msec(interval_type, interval_period_msec, interval_offset_msec, epoch_time_last_event_msec)
+    
+    
+    @micropython.native
+    def _epoch_time_next_event_msec(self, interval_type: TimeIntoIntervalTypes, interval_period_msec: int, interval_offset_msec: int, epoch_time_last_event_msec: int = 0) -> int:
+        """
+        # _epoch_time_next_event_msec
+        
+        Calculates epoch time of the next event in milliseconds from already validated and normalized 
+        interval period and offset in milliseconds.  See `epoch_time_next_event_msec`.
+
+        Args:
+            interval_type (TimeIntoIntervalTypes): Interval precision type (seconds, minutes, hours).
+            interval_period_msec (int): Interval period in milliseconds.
+            interval_offset_msec (int): Interval offset in milliseconds.
+            epoch_time_last_event_msec (int, optional): Epoch time of the last event in milliseconds. Defaults to 0.
 
-        # Get now system unix epoch time parts
-        (now_year, now_month, now_day, now_h, now_m, now_s, now_dow, now_doy) = time.gmtime()
-        
-        # Define next system unix epoch time parts
-        next_year  = 0
-        next_month = 0
-        next_day   = 0
-        next_h     = 0
-        next_m     = 0
-        next_s     = 0
-        next_dow   = 0
-        next_doy   = 0
-        
-        # Initialize next time-parts localtime based on interval-type
-        if interval_type == TimeIntoIntervalTypes.TIME_INTO_INTERVAL_SEC:
-            next_year  = now_year
-            next_month = now_month
-            next_day   = now_day
-            next_h     = now_h
-            next_m     = now_m
-            next_s     = 0
-        elif interval_type == TimeIntoIntervalTypes.TIME_INTO_INTERVAL_MIN:
-            next_year  = now_year
-            next_month = now_month
-            next_day   = now_day
-            next_h     = now_h
-            next_m     = 0
-            next_s     = 0
-        elif interval_type == TimeIntoIntervalTypes.TIME_INTO_INTERVAL_HR:
-            next_year  = now_year
-            next_month = now_month
-            next_day   = now_day
-            next_h     = 0
-            next_m     = 0
-            next_s     = 0
-        
-        # Handle interval period by time-parts time-span exceedance
-        if interval_period_msec > 60 * 1000:
-            # Over 60-seconds, set minute time-part to 0
-            next_m = 0
-            next_s = 0
-        elif interval_period_msec > 60 * 60 * 1000:
-            # Over 60-minutes, set hour time-part to 0
-            next_h = 0
-            next_m = 0
-            next_s = 0
-        elif interval_period_msec > 24 * 60 * 60 * 1000:
-            # Over 24-hours, set day time-part to 0
-            next_day = 0
-            next_h   = 0
-            next_m   = 0
-            next_s   = 0
-        
-        # Initialize next epoch time event.
-        epoch_time_next_event_msec = 0
+        Returns:
+            int: Epoch time of the next event in milliseconds.
+            
+        """
+        # Get now system unix epoch time once
+        now_msec = self.epoch_time_msec
         
         # Validate if the last task event was computed.
         if epoch_time_last_event_msec > 0:
@@ -235,36 +237,35 @@ class TimeIntoInterval:
             # compute next task event epoch.
             epoch_time_next_event_msec = epoch_time_last_event_msec + interval_period_msec
             
-            # Compute the delta between now and next unix times.
-            delta_time_msec = epoch_time_next_event_msec - self.epoch_time_msec
-            
-            # Ensure next task event is ahead in time, otherwise,
-            # recompute the next task event time.
-            if delta_time_msec < 0:
-                # Next task event is not ahead in time, set next 
-                # task event to 0, and regenerate next time event.
-                epoch_time_next_event_msec = 0
-        
-        # Validate if the next task event was computed.    
-        if epoch_time_next_event_msec == 0:
-            # Convert next time parts to unix epoch time in milliseconds
-            epoch_time_next_event_msec = int(round(time.mktime((next_year, next_month, next_day, next_h, next_m, next_s, next_dow, next_doy)) * 1000))
-            
-            # Initialize next unix time by adding the task event interval period and offset
-            epoch_time_next_event_msec = epoch_time_next_event_msec + interval_period_msec + interval_offset_msec
-            
-            # Compute the delta between now and next unix times
-            delta_time_msec = epoch_time_next_event_msec - self.epoch_time_msec
-            
-            # Ensure next task event is ahead in time
-            if delta_time_msec <= 0:
-                # Next task event is not ahead in time
-                while delta_time_msec < 0:
-                    # Keep adding task event intervals until next task event is ahead in time
-                    epoch_time_next_event_msec = epoch_time_next_event_msec + interval_period_msec
-                    
-                    # Compute the delta between now and next unix times
-                    delta_time_msec = epoch_time_next_event_msec - self.epoch_time_msec
+            # Steady-state: next task event is ahead in time, no calendar alignment required
+            if epoch_time_next_event_msec >= now_msec:
+                return epoch_time_next_event_msec
+        
+        # Wall-clock alignment based on interval-type
+        align_msec = _INTERVAL_ALIGN_MSEC[interval_type]
+        
+        # Handle interval period by time-parts time-span exceedance, largest time-span first
+        if interval_period_msec > _MSEC_PER_HR:
+            # Over 60-minutes, align to the start of the day (also over 24-hours, the unix epoch is day aligned)
+            align_msec = _MSEC_PER_DAY
+        elif interval_period_msec > _MSEC_PER_MIN and align_msec < _MSEC_PER_HR:
+            # Over 60-seconds, align to the start of the hour
+            align_msec = _MSEC_PER_HR
+        
+        # Align now to the start of the minute, hour or day (utc), no calendar conversion required
+        epoch_time_next_event_msec = now_msec - now_msec % align_msec
+        
+        # Initialize next unix time by adding the task event interval period and offset
+        epoch_time_next_event_msec = epoch_time_next_event_msec + interval_period_msec + interval_offset_msec
+        
+        # Compute the delta between now and next unix times
+        delta_time_msec = epoch_time_next_event_msec - now_msec
+        
+        # Ensure next task event is ahead in time
+        if delta_time_msec < 0:
+            # Next task event is not ahead in time, add the number of whole task event 
+            # intervals (rounded up) that puts the next task event ahead in time
+            epoch_time_next_event_msec += (-delta_time_msec + interval_period_msec - 1) // interval_period_msec * interval_period_msec
         
         # Return next task event epoch time
         return epoch_time_next_event_msec
@@ -291,18 +292,14 @@ class TimeIntoInterval:
         if not interval_period > 0:
             raise ValueError("Interval period cannot be less than or equal to 0")
         
-        # Normalize interval period to milliseconds
-        interval_period_msec = self.normalize_interval_msec(interval_type, interval_period)
-        
-        # Validate interval period argument on total days
-        if interval_period_msec >= (28 * 24 * 60 * 60 * 1000):
-            raise ValueError("Interval period cannot be greater than 28-days")
-        
-        # Convert interval into msec
-        interval_msec = self.normalize_interval_msec(interval_type, interval_period)
+        # Normalize interval period to milliseconds, reuse the cached value for this interval
+        if interval_type == self._interval_type and interval_period == self._interval_period:
+            interval_period_msec = self._interval_period_msec
+        else:
+            interval_period_msec = self.normalize_interval_msec(interval_type, interval_period)
         
         # Set last event epoch timestamp
-        return self.next_epoch_time_msec - interval_msec
+        return self.next_epoch_time_msec - interval_period_msec
     
     
     def interval_elapsed(self) -> bool:
@@ -317,20 +314,19 @@ class TimeIntoInterval:
             bool: Interval has elapsed when true, otherwise, false
             
         """
-        state = False
+        # Get next event, computed on first use
+        next_epoch_time_msec = self._next_epoch_time_msec
+        if next_epoch_time_msec is None:
+            next_epoch_time_msec = self.next_epoch_time_msec
         
-        # Compute time delta until next time into interval condition
-        delta_time_msec = self.next_epoch_time_msec - self.epoch_time_msec
+        # Validate time delta until next time into interval condition, when delta is > 0, time has not elapsed
+        if next_epoch_time_msec - self.epoch_time_msec > 0:
+            return False
         
-        # Validate time delta, when delta is <= 0, time has elapsed
-        if delta_time_msec <= 0:
-            # Set time-into-interval state to true - intervale has lapsed
-            state = True
-            
-            # Set next event timestamp (UTC)
-            self._next_epoch_time_msec = self.epoch_time_next_event_msec(self.interval_type, self.interval_period, self.interval_offset, self.next_epoch_time_msec)
+        # Interval has lapsed, set next event timestamp (UTC)
+        self._next_epoch_time_msec = self._epoch_time_next_event_msec(self._interval_type, self._interval_period_msec, self._interval_offset_msec, next_epoch_time_msec)
         
-        return state
+        return True
     
     
     async def interval_sleep(self) -> None:
@@ -342,36 +338,49 @@ class TimeIntoInterval:
         type, period, and offset arguments that is synchronized to the system clock.
         
         """
+        # Get now system unix epoch time once
+        now_msec = self.epoch_time_msec
+        
+        # Get next event, computed on first use
+        next_epoch_time_msec = self._next_epoch_time_msec
+        if next_epoch_time_msec is None:
+            next_epoch_time_msec = self.next_epoch_time_msec
+        
         # Compute time delta until next scan event
-        delta_time_msec = self.next_epoch_time_msec - self.epoch_time_msec
+        delta_time_msec = next_epoch_time_msec - now_msec
         
         # Validate time is into the future, otherwise, reset next epoch time
         if delta_time_msec <= 0:
             # Set epoch timestamp of the next scheduled task
-            self._next_epoch_time_msec = self.epoch_time_next_event_msec(self.interval_type, self.interval_period, self.interval_offset, self.next_epoch_time_msec)
+            next_epoch_time_msec = self._epoch_time_next_event_msec(self._interval_type, self._interval_period_msec, self._interval_offset_msec, next_epoch_time_msec)
+            self._next_epoch_time_msec = next_epoch_time_msec
             
             # Compute time delta for next event
-            delta_time_msec = self.next_epoch_time_msec - self.epoch_time_msec
+            delta_time_msec = next_epoch_time_msec - now_msec
         
-        # delay the tasks
-        await self._long_sleep_msec(delta_time_msec)
+        # delay the tasks, or only yield to the event loop when the event is already due
+        if delta_time_msec > 0:
+            await self._long_sleep_msec(delta_time_msec)
+        else:
+            await asyncio.sleep_ms(0)
         
         # Set epoch timestamp of the next scheduled task
-        self._next_epoch_time_msec = self.epoch_time_next_event_msec(self.interval_type, self.interval_period, self.interval_offset, self.next_epoch_time_msec)
+        self._next_epoch_time_msec = self._epoch_time_next_event_msec(self._interval_type, self._interval_period_msec, self._interval_offset_msec, self._next_epoch_time_msec)
         
         
     @property
+    @micropython.native
     def epoch_time_msec(self) -> int:
         """
         # epoch_time_msec
         
-        Gets epoch time in milliseconds from the system clock.
+        Gets epoch time in milliseconds from the system clock using integer arithmetic only.
 
         Returns:
             int: Epoch time in milliseconds.
             
         """
-        return int(round(time.time() * 1000))
+        return _time_ns() // 1000000
     
     
     @property
@@ -421,10 +430,12 @@ class TimeIntoInterval:
         """
         # next_epoch_time_msec
         
-        Gets next epoch time event in milliseconds.
+        Gets next epoch time event in milliseconds, computed from the system clock on first use.
 
         Returns:
             int: Next epoch time event in milliseconds.
             
         """
+        if self._next_epoch_time_msec is None:
+            self._next_epoch_time_msec = self._epoch_time_next_event_msec(self._interval_type, self._interval_period_msec, self._interval_offset_msec)
         return self._next_epoch_time_msec
\ No newline at end of file
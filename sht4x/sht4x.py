@@ -164,13 +164,25 @@ class SHT4X:
         If you use t the heater function, sensor will be not give a response
         back. Waiting time is added to the logic to account for this situation
         """
+        time.sleep_ms(self.start_measurement())
+        return self.read_measurements()
 
-        self._i2c.writeto(self._address, bytes([self._command]), False)
+    def start_measurement(self) -> int:
+        """Send the measurement command without waiting for the result, so the
+        bus can be used for other devices while the sensor converts.
+        Returns the time in milliseconds to wait before `read_measurements`
+        """
+        self._i2c.writeto(self._address, bytes([self._command]))
         if self._command in (0x39, 0x2F, 0x1E):
-            time.sleep(1.2)
+            return 1400
         elif self._command in (0x32, 0x24, 0x15):
-            time.sleep(0.2)
-        time.sleep(0.2)
+            return 400
+        return 200
+
+    def read_measurements(self) -> Tuple[float, float]:
+        """Read `temperature` and `relative_humidity` of the measurement
+        started with `start_measurement`
+        """
         self._i2c.readfrom_into(self._address, self._data)
 
         temperature, temp_crc, humidity, humidity_crc = struct.unpack_from(
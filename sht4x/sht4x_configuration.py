@@ -1,3 +1,4 @@
+import micropython
 from micropython import const
 
 """
@@ -18,8 +19,17 @@ class SHT4XHeaterTimespan(IntEnum):
     HEATER_TIMESPAN_1MS  = const(1)
 """
 
+
+@micropython.viper
+def _pack_config_byte(temperature_precision: int, heater_power: int, heater_timespan: int) -> int:
+    """Pack temperature precision, heater power, heater timespan into a config byte"""
+    return temperature_precision << 5 | heater_power << 2 | heater_timespan
+
+
 class SHT4XConfiguration:
     
+    __slots__ = ('_temperature_precision', '_heater_power', '_heater_timespan', '_config_buf')
+    
     HIGH_PRECISION   = const(0)
     MEDIUM_PRECISION = const(1)
     LOW_PRECISION    = const(2)
@@ -36,6 +46,13 @@ class SHT4XConfiguration:
         self._temperature_precision: int = SHT4XConfiguration.HIGH_PRECISION
         self._heater_power: int = SHT4XConfiguration.HEATER_POWER_20MW
         self._heater_timespan: int = SHT4XConfiguration.HEATER_TIMESPAN_1SEC
+        self._config_buf = bytearray(1)
+        self._pack_config()
+        
+        
+    def _pack_config(self) -> None:
+        """Pack temperature precision, heater power, heater timespan into the config buffer"""
+        self._config_buf[0] = _pack_config_byte(self._temperature_precision, self._heater_power, self._heater_timespan)
         
         
     @property
@@ -44,11 +61,9 @@ class SHT4XConfiguration:
 
         This returns the temperature precision, heater power, heater timespan configuration as stored in an instance of this class. It
         may differ from that stored on the chip. The information is returned in a format that can be written to the
-        chip.
+        chip. The buffer is packed when a setting changes and is shared between calls, it must not be modified.
         """
-        array = bytearray(1)
-        array[0] = self._temperature_precision << 5 | self._heater_power << 2 | self._heater_timespan
-        return array
+        return self._config_buf
     
     
     @property
@@ -61,6 +76,7 @@ class SHT4XConfiguration:
     def temperature_precision(self, temperature_precision: int):
         """Set temperature_precision"""
         self._temperature_precision = temperature_precision
+        self._pack_config()
     
     
     @property
@@ -73,6 +89,7 @@ class SHT4XConfiguration:
     def heater_power(self, heater_power: int):
         """Set heater_power"""
         self._heater_power = heater_power
+        self._pack_config()
         
     
     @property
@@ -85,5 +102,6 @@ class SHT4XConfiguration:
     def heater_timespan(self, heater_timespan: int):
         """Set heater_timespan"""
         self._heater_timespan = heater_timespan
+        self._pack_config()
     
     
\ No newline at end of file
@@ -1,7 +1,8 @@
 # Copyright (c) 2024 Eric Gionet (gionet.c.eric@gmail.com)
 # Released under the MIT License (MIT) - see LICENSE file
 
-import time
+import micropython
+from time import gmtime as _sys_gmtime, mktime as _sys_mktime
 
 """
 inspired by:
@@ -19,6 +20,25 @@ tz = [ [        -8,0,0 ], # Time offset  [      H,M,S] -8, PST
 
 
 
+def _schedule_key(month: int, day: int, hour: int, minute: int) -> int:
+    """
+    # _schedule_key
+    
+    Packs a month, day, hour and minute into an int that orders like the date-time.
+
+    Args:
+        month (int): Month (1..12).
+        day (int): Day of month (1..31).
+        hour (int): Hour (0..23).
+        minute (int): Minute (0..59).
+
+    Returns:
+        int: Packed schedule key.
+        
+    """
+    return ((month * 32 + day) * 24 + hour) * 60 + minute
+
+
 class TimeOffset:
     """
     # TimeOffset
@@ -26,6 +46,8 @@ class TimeOffset:
     This class configures UTC time offset.
     
     """
+    __slots__ = ('_hour', '_minute', '_as_tuple')
+    
     def __init__(self, hour = 0, minute = 0):
         """
         # TimeOffset
@@ -37,8 +59,9 @@ class TimeOffset:
             minute (int, optional): Time-zone minute offset from UTC. Defaults to 0.
             
         """
-        self._hour   = hour
-        self._minute = minute
+        self._hour     = hour
+        self._minute   = minute
+        self._as_tuple = (hour, minute)
 
     @property
     def hour(self) -> int:
@@ -90,10 +113,20 @@ class TimeOffset:
             list: Time offset parameters as a list.
             
         """
-        lst = []
-        lst.append(self._hour)
-        lst.append(self._minute)
-        return lst
+        return list(self._as_tuple)
+    
+    @property
+    def to_tuple(self) -> tuple:
+        """
+        # to_tuple
+        
+        Gets time offset parameters as a shared tuple, without allocating.
+
+        Returns:
+            tuple: Time offset parameters as a tuple.
+            
+        """
+        return self._as_tuple
 
 
 class DSTAdjust:
@@ -105,6 +138,8 @@ class DSTAdjust:
     This class configures the daylight saving time adjustment.
     
     """
+    __slots__ = ('_hour', '_minute', '_as_tuple')
+    
     def __init__(self, hour = 0, minute = 0):
         """
         # DSTAdjust
@@ -116,8 +151,9 @@ class DSTAdjust:
             minute (int, optional): Daylight saving time minute adjustment. Defaults to 0.
             
         """
-        self._hour   = hour
-        self._minute = minute
+        self._hour     = hour
+        self._minute   = minute
+        self._as_tuple = (hour, minute)
 
     @property
     def hour(self) -> int:
@@ -169,10 +205,20 @@ class DSTAdjust:
             list: DST adjust parameters as a list.
             
         """
-        lst = []
-        lst.append(self._hour)
-        lst.append(self._minute)
-        return lst
+        return list(self._as_tuple)
+    
+    @property
+    def to_tuple(self) -> tuple:
+        """
+        # to_tuple
+        
+        Gets DST adjust parameters as a shared tuple, without allocating.
+
+        Returns:
+            tuple: DST adjust parameters as a tuple.
+            
+        """
+        return self._as_tuple
 
 
 
@@ -185,6 +231,8 @@ class DSTSchedule:
     This class configures daylight saving time start and end schedules.
     
     """
+    __slots__ = ('_month', '_day', '_hour', '_minute', '_as_tuple')
+    
     def __init__(self, month = 0, day = 0, hour = 0, minute = 0):
         """
         # DSTSchedule
@@ -198,10 +246,11 @@ class DSTSchedule:
             minute (int, optional): Daylight saving time schedule minute. Defaults to 0.
             
         """
-        self._month  = month
-        self._day    = day
-        self._hour   = hour
-        self._minute = minute
+        self._month    = month
+        self._day      = day
+        self._hour     = hour
+        self._minute   = minute
+        self._as_tuple = (month, day, hour, minute)
 
     @property
     def month(self) -> int:
@@ -266,12 +315,20 @@ class DSTSchedule:
             list: DST schedule parameters as a list.
             
         """
-        lst = []
-        lst.append(self._month)
-        lst.append(self._day)
-        lst.append(self._hour)
-        lst.append(self._minute)
-        return lst
+        return list(self._as_tuple)
+    
+    @property
+    def to_tuple(self) -> tuple:
+        """
+        # to_tuple
+        
+        Gets DST schedule parameters as a shared tuple, without allocating.
+
+        Returns:
+            tuple: DST schedule parameters as a tuple.
+            
+        """
+        return self._as_tuple
 
 
 class TimezoneInfo:
@@ -281,6 +338,9 @@ class TimezoneInfo:
     This class configures time-zone offset, DST start, DST end, and DST adjust parameters.
     
     """
+    __slots__ = ('_timeoffset', '_dststart', '_dstend', '_dstadjust', '_as_tuple',
+                 '_offset_s', '_adjust_s', '_start_key', '_end_key', '_offset_at', '_timezone')
+    
     def __init__(self, timeoffset: TimeOffset, dststart: DSTSchedule, dstend: DSTSchedule, dstadjust: DSTAdjust):
         """
         # TimezoneInfo
@@ -304,6 +364,60 @@ class TimezoneInfo:
         self._dststart   = dststart
         self._dstend     = dstend
         self._dstadjust  = dstadjust
+        self._as_tuple   = (timeoffset._as_tuple, dststart._as_tuple, dstend._as_tuple, dstadjust._as_tuple)
+        
+        # Parameters are immutable, hoist them to plain ints for localtime
+        self._offset_s  = timeoffset.offset
+        self._adjust_s  = dstadjust.adjust
+        
+        # DST start and end schedules packed into comparable ints (see _schedule_key)
+        self._start_key = _schedule_key(dststart._month, dststart._day, dststart._hour, dststart._minute)
+        self._end_key   = _schedule_key(dstend._month, dstend._day, dstend._hour, dstend._minute)
+        
+        # Offset in seconds at a packed schedule key, specialized with the keys and offsets bound as locals
+        def offset_at(key, start_key=self._start_key, end_key=self._end_key, std_s=self._offset_s, dst_s=self._offset_s + self._adjust_s) -> int:
+            return dst_s if start_key <= key < end_key else std_s
+        self._offset_at = offset_at
+        
+        # Timezone string from the offset (i.e. GMT, GMT+4, GMT-05:30), signed by the whole offset
+        sign = "-" if self._offset_s < 0 else "+"
+        hrs, mins = divmod(abs(self._offset_s) // 60, 60)
+        if mins:
+            self._timezone = "GMT%s%02d:%02d" % (sign, hrs, mins)
+        elif hrs:
+            self._timezone = "GMT%s%d" % (sign, hrs)
+        else:
+            self._timezone = "GMT"
+    
+    def next_dst_boundary(self, epoch: int) -> int:
+        """
+        # next_dst_boundary
+        
+        Gets the next DST start or end after a unix epoch time.  DST schedules are compared 
+        against the UTC month, day, hour and minute (see localtime), so the boundary is a UTC time.
+
+        Args:
+            epoch (int): Unix epoch time in seconds.
+
+        Returns:
+            int: Unix epoch time in seconds of the next DST start or end, None when the time-zone has no DST window.
+            
+        """
+        # Same window as offset_at, no adjustment or an empty window never switches
+        if self._adjust_s == 0 or self._start_key >= self._end_key:
+            return None
+        
+        year = _sys_gmtime(epoch)[0]
+        boundary = None
+        for schedule in (self._dststart, self._dstend):
+            # This year's schedule when still ahead, otherwise next year's
+            for y in (year, year + 1):
+                t = _sys_mktime((y, schedule._month, schedule._day, schedule._hour, schedule._minute, 0, 0, 0))
+                if t > epoch:
+                    if boundary is None or t < boundary:
+                        boundary = t
+                    break
+        return boundary
     
     @property
     def timezone(self) -> str:
@@ -316,14 +430,7 @@ class TimezoneInfo:
             str: Timezone as a formatted string (i.e. GMT+4, GMT-05:30, etc.).
             
         """
-        tz = "GMT"
-        if self._timeoffset.hour > 0:
-            tz += "+"
-        if self._timeoffset.minute == 0 and self._timeoffset.hour != 0:
-            tz += str(self._timeoffset.hour)
-        if(self._timeoffset.minute > 0):
-            tz += "{:02d}{:02d}".format(self._timeoffset.hour, self._timeoffset.minute)
-        return tz
+        return self._timezone
     
     @property
     def timeoffset(self) -> TimeOffset:
@@ -388,14 +495,32 @@ class TimezoneInfo:
             list: time-zone parameters as a list.
             
         """
-        lst = []
-        lst.append(self._timeoffset.to_list)
-        lst.append(self._dststart.to_list)
-        lst.append(self._dstend.to_list)
-        lst.append(self._dstadjust.to_list)
-        return lst
+        return [list(parameters) for parameters in self._as_tuple]
+    
+    @property
+    def to_tuple(self) -> tuple:
+        """
+        # to_tuple
+        
+        Gets time-zone parameters as a shared tuple of tuples, without allocating.
+
+        Returns:
+            tuple: Time-zone parameters as a tuple.
+            
+        """
+        return self._as_tuple
     
 
+# Days in each month of a non-leap year
+#                 Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec
+_DAYS_IN_MONTH = ( 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Cumulative days before the first of each month in a non-leap year
+#           Jan Feb Mar Apr  May  Jun  Jul  Aug  Sep  Oct  Nov  Dec
+_CUMDAYS = (  0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# Leap year results by year
+_leap_cache = {}
 
 
 
@@ -409,13 +534,8 @@ def gmtime() -> tuple:
         tuple: UTC-time as a tuple (year, month, day, h, m, s, dow, doy).
         
     """
-    utc = time.gmtime()
-    if len(utc) <= 8:
-        return utc
-    lst = []
-    for this in utc[:8]:
-        lst.append(this)
-    return tuple(lst)
+    utc = _sys_gmtime()
+    return utc if len(utc) <= 8 else utc[:8]
 
 
 def is_leap_year(year: int) -> bool:
@@ -431,10 +551,14 @@ def is_leap_year(year: int) -> bool:
         bool: True when the year is a leap year, otherwise False.
         
     """
-    if (year % 400) == 0 : return True
-    if (year % 100) == 0 : return False
-    if (year %   4) == 0 : return True
-    else                 : return False
+    leap = _leap_cache.get(year)
+    if leap is None:
+        # Bounded, the cache only ever sees the current year and its neighbours
+        if len(_leap_cache) >= 8:
+            _leap_cache.clear()
+        leap = (year % 4) == 0 and ((year % 100) != 0 or (year % 400) == 0)
+        _leap_cache[year] = leap
+    return leap
 
 
 def days_in_month(year: int, month: int) -> int:
@@ -451,12 +575,65 @@ def days_in_month(year: int, month: int) -> int:
         int: Number of days in the month.
         
     """
-    dif = 28 + is_leap_year(year)
-    #       Jan Feb  Mar Apr May Jun Jul Aug Sep Oct Nov Dec
-    return [31, dif, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month-1]
+    if month == 2 and is_leap_year(year):
+        return 29
+    return _DAYS_IN_MONTH[month-1]
+
+
+@micropython.native
+def _apply_tz(year, month, day, h, m, s, dow, doy, delta) -> tuple:
+    """
+    # _apply_tz
+    
+    Converts UTC-time parts to local-time parts by a time-zone offset in seconds.
+
+    Args:
+        year (int): UTC year.
+        month (int): UTC month (1..12).
+        day (int): UTC day of month (1..31).
+        h (int): UTC hour (0..23).
+        m (int): UTC minute (0..59).
+        s (int): UTC second (0..59).
+        dow (int): UTC day of week (0..6 Mon..Sun).
+        doy (int): UTC day of year (1..366).
+        delta (int): Time-zone offset in seconds, including the DST adjustment when DST is in effect.
+
+    Returns:
+        tuple: Local-time as a tuple (year, month, day, h, m, s, dow, doy).
+    
+    """
+    # Apply the offset to the seconds into the day and roll over into days in a single step
+    days_delta, s = divmod(h * 3600 + m * 60 + s + delta, 86400)
+    h, s = divmod(s, 3600)
+    m, s = divmod(s, 60)
+    if days_delta:
+        dow  = (dow + days_delta) % 7
+        doy += days_delta
+        leap = 1 if is_leap_year(year) else 0
+        # Update Y when the day of year crosses the year boundary
+        if doy < 1:
+            year -= 1
+            leap  = 1 if is_leap_year(year) else 0
+            doy  += 365 + leap
+        elif doy > 365 + leap:
+            doy  -= 365 + leap
+            year += 1
+            leap  = 1 if is_leap_year(year) else 0
+        # Update M,D from the day of year, binary search for the last month starting before it
+        lo = 1
+        hi = 12
+        while lo < hi:
+            mid = (lo + hi + 1) >> 1
+            if _CUMDAYS[mid - 1] + (leap if mid > 2 else 0) < doy:
+                lo = mid
+            else:
+                hi = mid - 1
+        month = lo
+        day   = doy - _CUMDAYS[month - 1] - (leap if month > 2 else 0)
+    return (year, month, day, h, m, s, dow, doy)
 
 
-def localtime(tz: TimezoneInfo) -> tuple:
+def localtime(tz: TimezoneInfo, _gmtime=gmtime, _key=_schedule_key, _apply=_apply_tz) -> tuple:
     """
     # localtime
     
@@ -470,6 +647,7 @@ def localtime(tz: TimezoneInfo) -> tuple:
 
     Args:
         tz (TimezoneInfo): Time-zone information object.
+        _gmtime, _key, _apply: Module helpers bound as locals, not to be passed.
 
     Returns:
         tuple: Local-time as a tuple (year, month, day, h, m, s, dow, doy).
@@ -477,42 +655,40 @@ def localtime(tz: TimezoneInfo) -> tuple:
     """
     #   0 1 2  3 4 5  6    7
     # ( Y,M,D, H,M,S, DOW, DOY )
-    (year, month, day, h, m, s, dow, doy) = gmtime()
-    
-    # Use as is when before DST start
-    if  month <  tz.dststart.month \
-    or (month == tz.dststart.month and day == tz.dststart.day and h <  tz.dststart.hour and m <  tz.dststart.minute):
-        pass
-    # Use as is when after DST ends
-    elif month >  tz.dstend.month \
-    or  (month == tz.dstend.month and day == tz.dstend.day and h <  tz.dstend.hour and m <  tz.dstend.minute):
-        pass
-    # Otherwise apply the DST adjustment
-    else:
-        m += tz.dstadjust.minute
-        h += tz.dstadjust.hour  
-    # Apply the time zone offset
-    m += tz.timeoffset.minute + int(s / 60)
-    h += tz.timeoffset.hour + int(m / 60)
-    s  = s % 60
-    m  = m % 60
-    # Update Y,M,D
-    while h >= 24:
-        h -= 24
-        day += 1
-        if day > days_in_month(year, month):
-            month += 1
-            day = 1
-        dow = (dow + 1) % 7
-        doy += 1
-    while h < 0:
-        h += 24
-        day -= 1
-        if day <= 0:
-            month -= 1
-            day = days_in_month(year, month)
-        dow = (dow + 8) % 7
-        doy -= 1
-    return (year, month, day, h, m, s, dow, doy)
+    (year, month, day, h, m, s, dow, doy) = _gmtime()
+    
+    # Time zone offset in seconds, plus the DST adjustment from DST start until DST ends
+    delta = tz._offset_at(_key(month, day, h, m))
+    
+    return _apply(year, month, day, h, m, s, dow, doy, delta)
+
 
+def localtime_many(tz: TimezoneInfo, epochs):
+    """
+    # localtime_many
+    
+    Converts unix epoch times (UTC) to local-time tuples by time-zone, in a batch.
+    
+    Examples:
+        Convert logged timestamps to local-time::
+        
+            for (year, month, day, hrs, mins, secs, wday, yday) in timezone.localtime_many(tz_info, timestamps):
+                ...
 
+    Args:
+        tz (TimezoneInfo): Time-zone information object.
+        epochs (iterable): Unix epoch times in seconds.
+
+    Yields:
+        tuple: Local-time as a tuple (year, month, day, h, m, s, dow, doy) for each epoch time.
+    
+    """
+    # Bind the time-zone and helpers once for the whole batch
+    offset_at  = tz._offset_at
+    sys_gmtime = _sys_gmtime
+    key        = _schedule_key
+    apply      = _apply_tz
+    
+    for epoch in epochs:
+        (year, month, day, h, m, s, dow, doy) = sys_gmtime(epoch)[:8]
+        yield apply(year, month, day, h, m, s, dow, doy, offset_at(key(month, day, h, m)))